@@ -1,33 +1,310 @@
 import tkinter as tk
 from tkinter import simpledialog, messagebox, filedialog
-import heapq
 import os
 
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def _bfs_csr(indptr, indices, start, n, dist, queue):
+    # dist and queue are caller-owned scratch; every vertex is enqueued
+    # at most once, so the queue never wraps.
+    INF = np.iinfo(np.int64).max
+    for i in range(n):
+        dist[i] = INF
+    pred = np.full(n, -1, dtype=np.int32)
+
+    dist[start] = 0
+    queue[0] = start
+    head = 0
+    tail = 1
+
+    while head < tail:
+        u = queue[head]
+        head += 1
+        next_dist = dist[u] + 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if dist[v] == INF:
+                dist[v] = next_dist
+                pred[v] = u
+                queue[tail] = v
+                tail += 1
+
+    distances = np.full(n, np.inf)
+    for i in range(n):
+        if dist[i] < INF:
+            distances[i] = dist[i]
+    return distances, pred
+
+@njit(cache=True)
+def _heap_push(heap_dist, heap_vert, heap_size, d, v):
+    j = heap_size
+    heap_dist[j] = d
+    heap_vert[j] = v
+    heap_size += 1
+    while j > 0:
+        parent = (j - 1) // 2
+        if heap_dist[parent] <= heap_dist[j]:
+            break
+        heap_dist[j], heap_dist[parent] = heap_dist[parent], heap_dist[j]
+        heap_vert[j], heap_vert[parent] = heap_vert[parent], heap_vert[j]
+        j = parent
+    return heap_size
+
+@njit(cache=True)
+def _heap_pop(heap_dist, heap_vert, heap_size):
+    d = heap_dist[0]
+    v = heap_vert[0]
+    heap_size -= 1
+    heap_dist[0] = heap_dist[heap_size]
+    heap_vert[0] = heap_vert[heap_size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        smallest = i
+        if left < heap_size and heap_dist[left] < heap_dist[smallest]:
+            smallest = left
+        if right < heap_size and heap_dist[right] < heap_dist[smallest]:
+            smallest = right
+        if smallest == i:
+            break
+        heap_dist[i], heap_dist[smallest] = heap_dist[smallest], heap_dist[i]
+        heap_vert[i], heap_vert[smallest] = heap_vert[smallest], heap_vert[i]
+        i = smallest
+    return d, v, heap_size
+
+@njit(cache=True)
+def _bidirectional_dijkstra_csr(indptr, indices, weights, rindptr, rindices, rweights, start, end, n):
+    INF = np.iinfo(np.int64).max
+    dist_f = np.full(n, INF, dtype=np.int64)
+    dist_b = np.full(n, INF, dtype=np.int64)
+    pred_f = np.full(n, -1, dtype=np.int32)
+    pred_b = np.full(n, -1, dtype=np.int32)
+    heap_dist_f = np.empty(indices.size + 1, dtype=np.int64)
+    heap_vert_f = np.empty(indices.size + 1, dtype=np.int32)
+    heap_dist_b = np.empty(rindices.size + 1, dtype=np.int64)
+    heap_vert_b = np.empty(rindices.size + 1, dtype=np.int32)
+
+    dist_f[start] = 0
+    dist_b[end] = 0
+    size_f = _heap_push(heap_dist_f, heap_vert_f, 0, 0, start)
+    size_b = _heap_push(heap_dist_b, heap_vert_b, 0, 0, end)
+    best = INF
+    meet = -1
+
+    while size_f > 0 and size_b > 0:
+        if heap_dist_f[0] + heap_dist_b[0] >= best:
+            break
+        if heap_dist_f[0] <= heap_dist_b[0]:
+            d, u, size_f = _heap_pop(heap_dist_f, heap_vert_f, size_f)
+            if d > dist_f[u]:
+                continue
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                distance = d + weights[k]
+                if distance < dist_f[v]:
+                    dist_f[v] = distance
+                    pred_f[v] = u
+                    size_f = _heap_push(heap_dist_f, heap_vert_f, size_f, distance, v)
+                if dist_b[v] < INF and dist_f[v] + dist_b[v] < best:
+                    best = dist_f[v] + dist_b[v]
+                    meet = v
+        else:
+            d, u, size_b = _heap_pop(heap_dist_b, heap_vert_b, size_b)
+            if d > dist_b[u]:
+                continue
+            for k in range(rindptr[u], rindptr[u + 1]):
+                v = rindices[k]
+                distance = d + rweights[k]
+                if distance < dist_b[v]:
+                    dist_b[v] = distance
+                    pred_b[v] = u
+                    size_b = _heap_push(heap_dist_b, heap_vert_b, size_b, distance, v)
+                if dist_f[v] < INF and dist_f[v] + dist_b[v] < best:
+                    best = dist_f[v] + dist_b[v]
+                    meet = v
+
+    return best, meet, pred_f, pred_b
+
+@njit(cache=True)
+def _dijkstra_csr(indptr, indices, weights, start, n, dist, bucket_head, entry_vertex, entry_next):
+    # dist, bucket_head, entry_vertex and entry_next are caller-owned
+    # scratch; bucket_head arrives all -1 and drains back to -1 because
+    # every pushed entry is popped before the kernel returns.
+    INF = np.iinfo(np.int64).max
+    for i in range(n):
+        dist[i] = INF
+    pred = np.full(n, -1, dtype=np.int32)
+    visited = np.zeros(n, dtype=np.uint8)
+
+    dist[start] = 0
+    entry_vertex[0] = start
+    entry_next[0] = -1
+    bucket_head[0] = 0
+    num_entries = 1
+    live_entries = 1
+    cursor = np.int64(0)
+
+    while live_entries > 0:
+        while bucket_head[cursor] == -1:
+            cursor += 1
+        entry = bucket_head[cursor]
+        bucket_head[cursor] = entry_next[entry]
+        live_entries -= 1
+        u = entry_vertex[entry]
+        if visited[u]:
+            continue
+        visited[u] = 1
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            distance = cursor + weights[k]
+            if distance < dist[v]:
+                dist[v] = distance
+                pred[v] = u
+                entry_vertex[num_entries] = v
+                entry_next[num_entries] = bucket_head[distance]
+                bucket_head[distance] = num_entries
+                num_entries += 1
+                live_entries += 1
+
+    distances = np.full(n, np.inf)
+    for i in range(n):
+        if dist[i] < INF:
+            distances[i] = dist[i]
+    return distances, pred
+
 class Graph:
     def __init__(self, directed=False):
         self.directed = directed
         self.adjacency_list = {}
-        self.edge_weights = {}
+        self.reverse_adjacency = {}
+        self._name_to_id = {}
+        self._id_to_name = []
+        self.indptr = None
+        self.indices = None
+        self.weights = None
+        self.degrees = None
+        self._rindptr = None
+        self._rindices = None
+        self._rweights = None
+        self._dist_buf = None
+        self._bucket_head = None
+        self._entry_vertex = None
+        self._entry_next = None
+        self._queue_buf = None
+        self._unit_weights = True
+        self._csr_valid = False
+        self._rev_csr_valid = False
+        self._odd_count = 0
+        self._edge_count = 0
+        self._version = 0
+        self._dijkstra_cache = {}
+
+    def _undirected_degree(self, vertex_id):
+        edges = self.adjacency_list[vertex_id]
+        # A self-loop is stored once but contributes 2 to the degree.
+        return len(edges) + (1 if vertex_id in edges else 0)
+
+    def _invalidate(self):
+        self._csr_valid = False
+        self._rev_csr_valid = False
+        self._version += 1
+        self._dijkstra_cache.clear()
+
+    def _intern(self, vertex):
+        vertex_id = self._name_to_id.get(vertex)
+        if vertex_id is None:
+            vertex_id = len(self._id_to_name)
+            self._name_to_id[vertex] = vertex_id
+            self._id_to_name.append(vertex)
+            self.adjacency_list[vertex_id] = {}
+            self._invalidate()
+        return vertex_id
 
     def add_vertex(self, vertex):
-        if vertex not in self.adjacency_list:
-            self.adjacency_list[vertex] = []
+        self._intern(vertex)
 
     def add_edge(self, source, target, weight=1):
-        if source not in self.adjacency_list:
-            self.add_vertex(source)
-        if target not in self.adjacency_list:
-            self.add_vertex(target)
+        source = self._intern(source)
+        target = self._intern(target)
+        if weight != 1:
+            self._unit_weights = False
 
-        self.adjacency_list[source].append(target)
-        self.edge_weights[(source, target)] = weight
+        is_new = target not in self.adjacency_list[source]
+        self.adjacency_list[source][target] = weight
+        self.reverse_adjacency.setdefault(target, {})[source] = weight
+        if is_new:
+            self._edge_count += 1
 
-        if not self.directed:
-            self.adjacency_list[target].append(source)
-            self.edge_weights[(target, source)] = weight
+        if self.directed:
+            if is_new:
+                self._odd_count += 1 if len(self.adjacency_list[source]) % 2 else -1
+        elif source != target:
+            self.adjacency_list[target][source] = weight
+            self.reverse_adjacency.setdefault(source, {})[target] = weight
+            if is_new:
+                self._odd_count += 1 if self._undirected_degree(source) % 2 else -1
+                self._odd_count += 1 if self._undirected_degree(target) % 2 else -1
+        # An undirected self-loop is stored once but adds 2 to the
+        # degree, so it leaves the parity count untouched.
+
+        self._invalidate()
+
+    def _build_csr(self):
+        n = len(self._id_to_name)
+
+        self.indptr = np.zeros(n + 1, dtype=np.int32)
+        for u, edges in self.adjacency_list.items():
+            self.indptr[u + 1] = len(edges)
+        np.cumsum(self.indptr, out=self.indptr)
+
+        num_edges = int(self.indptr[-1])
+        self.indices = np.empty(num_edges, dtype=np.int32)
+        self.weights = np.empty(num_edges, dtype=np.int32)
+        offsets = self.indptr[:-1].copy()
+        for u, edges in self.adjacency_list.items():
+            for v, weight in edges.items():
+                k = offsets[u]
+                self.indices[k] = v
+                self.weights[k] = weight
+                offsets[u] = k + 1
+
+        self.degrees = np.diff(self.indptr)
+        self._csr_valid = True
+
+    def _build_reverse_csr(self):
+        # Transpose the forward CSR rather than reading reverse_adjacency
+        # or aliasing: the forward arrays are authoritative even if the
+        # directed flag was toggled after edges were added.
+        n = len(self._id_to_name)
+        self._rindptr = np.zeros(n + 1, dtype=np.int32)
+        self._rindptr[1:] = np.cumsum(np.bincount(self.indices, minlength=n))
+        order = np.argsort(self.indices, kind='stable')
+        sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(self.indptr))
+        self._rindices = sources[order]
+        self._rweights = self.weights[order]
+        self._rev_csr_valid = True
+
+    def _ensure_scratch(self):
+        n = len(self._id_to_name)
+        num_edges = self.indices.size
+        max_weight = int(self.weights.max()) if num_edges else 1
+        span = max(n - 1, 0) * max(max_weight, 1) + 1
+        if self._dist_buf is None or self._dist_buf.size < n:
+            self._dist_buf = np.empty(n, dtype=np.int64)
+        if self._entry_vertex is None or self._entry_vertex.size < num_edges + 1:
+            self._entry_vertex = np.empty(num_edges + 1, dtype=np.int32)
+            self._entry_next = np.empty(num_edges + 1, dtype=np.int64)
+        if self._bucket_head is None or self._bucket_head.size < span:
+            self._bucket_head = np.full(span, -1, dtype=np.int64)
+        if self._queue_buf is None or self._queue_buf.size < n:
+            self._queue_buf = np.empty(n, dtype=np.int32)
 
     def is_eulerian(self):
-        odd_degree_vertices = sum(1 for vertex, adj in self.adjacency_list.items() if len(adj) % 2 != 0)
+        odd_degree_vertices = self._odd_count
         if odd_degree_vertices == 0:
             return True, False  # Eulerian
         elif odd_degree_vertices == 2:
@@ -36,72 +313,208 @@ class Graph:
 
     def load_from_file(self, file_path):
         with open(file_path, 'r') as file:
-            for line in file:
-                parts = line.strip().split()
-                source, target, weight = parts[0], parts[1], int(parts[2])
-                self.add_edge(source, target, weight)
+            data = file.read().split()
+        if not data:
+            return
+
+        arr = np.array(data).reshape(-1, 3)
+        if self.adjacency_list:
+            # Merging into a non-empty graph: reuse the incremental path.
+            for source, target, weight in arr:
+                self.add_edge(source, target, int(weight))
+            return
+
+        num_lines = arr.shape[0]
+        file_weights = arr[:, 2].astype(np.int64)
+        if not np.all(file_weights == 1):
+            self._unit_weights = False
+        names, inverse = np.unique(np.concatenate([arr[:, 0], arr[:, 1]]), return_inverse=True)
+        src = inverse[:num_lines].astype(np.int32)
+        tgt = inverse[num_lines:].astype(np.int32)
+
+        if self.directed:
+            edge_src, edge_tgt, edge_weights = src, tgt, file_weights
+        else:
+            edge_src = np.concatenate([src, tgt])
+            edge_tgt = np.concatenate([tgt, src])
+            edge_weights = np.concatenate([file_weights, file_weights])
+
+        n = len(names)
+        self._invalidate()
+        self._id_to_name = names.tolist()
+        self._name_to_id = {name: i for i, name in enumerate(self._id_to_name)}
+        for vertex_id in range(n):
+            self.adjacency_list[vertex_id] = {}
+        for k in range(num_lines):
+            source, target, weight = int(src[k]), int(tgt[k]), int(file_weights[k])
+            self.adjacency_list[source][target] = weight
+            self.reverse_adjacency.setdefault(target, {})[source] = weight
+            if not self.directed:
+                self.adjacency_list[target][source] = weight
+                self.reverse_adjacency.setdefault(source, {})[target] = weight
+        edge_key = edge_src.astype(np.int64) * n + edge_tgt
+        if np.unique(edge_key).size != edge_key.size:
+            # Duplicate edges collapse in the dicts; let the CSR rebuild
+            # from them lazily and count from the dicts instead.
+            if self.directed:
+                self._odd_count = sum(1 for edges in self.adjacency_list.values() if len(edges) % 2)
+                self._edge_count = sum(len(edges) for edges in self.adjacency_list.values())
+            else:
+                self._odd_count = sum(1 for u in self.adjacency_list if self._undirected_degree(u) % 2)
+                # A self-loop stores a single entry but counts as one edge.
+                total_entries = sum(len(edges) for edges in self.adjacency_list.values())
+                loops = sum(1 for u, edges in self.adjacency_list.items() if u in edges)
+                self._edge_count = (total_entries + loops) // 2
+            return
+
+        order = np.argsort(edge_src, kind='stable')
+        self.indptr = np.zeros(n + 1, dtype=np.int32)
+        self.indptr[1:] = np.cumsum(np.bincount(edge_src, minlength=n))
+        self.indices = edge_tgt[order]
+        self.weights = edge_weights[order].astype(np.int32)
+        self.degrees = np.diff(self.indptr)
+        self._odd_count = int((self.degrees & 1).sum())
+        self._edge_count = num_lines
+        self._csr_valid = True
 
     def display_graph(self):
-        graph_representation = ""
-        for vertex, edges in self.adjacency_list.items():
-            edges_with_weights = [f"{edge} (Weight: {self.edge_weights.get((vertex, edge), 'N/A')})" for edge in edges]
-            graph_representation += f"{vertex}: {', '.join(edges_with_weights)}\n"
-        return graph_representation
+        names = self._id_to_name
+        lines = []
+        for vertex_id, edges in self.adjacency_list.items():
+            edges_with_weights = ", ".join(f"{names[edge]} (Weight: {weight})" for edge, weight in edges.items())
+            lines.append(f"{names[vertex_id]}: {edges_with_weights}\n")
+        return "".join(lines)
 
     def get_order(self):
         return len(self.adjacency_list)
 
     def get_size(self):
-        return sum(len(edges) for edges in self.adjacency_list.values()) // (2 if not self.directed else 1)
+        return self._edge_count
 
     def get_adjacent_vertices(self, vertex):
-        return self.adjacency_list.get(vertex, [])
+        vertex_id = self._name_to_id.get(vertex)
+        if vertex_id is None:
+            return []
+        return [self._id_to_name[neighbor] for neighbor in self.adjacency_list[vertex_id]]
 
     def get_degree(self, vertex):
+        vertex_id = self._name_to_id.get(vertex)
         if self.directed:
-            out_degree = len(self.adjacency_list.get(vertex, []))
-            in_degree = sum(vertex in edges for edges in self.adjacency_list.values())
+            out_degree = len(self.adjacency_list.get(vertex_id, {}))
+            in_degree = len(self.reverse_adjacency.get(vertex_id, {}))
             return {'in_degree': in_degree, 'out_degree': out_degree}
         else:
-            return len(self.adjacency_list.get(vertex, []))
+            if vertex_id is None:
+                return 0
+            return self._undirected_degree(vertex_id)
 
     def are_adjacent(self, v1, v2):
-        return v2 in self.adjacency_list.get(v1, [])
+        id1 = self._name_to_id.get(v1)
+        id2 = self._name_to_id.get(v2)
+        return id2 in self.adjacency_list.get(id1, {})
 
     def dijkstra(self, start_vertex):
-        distances = {vertex: float('infinity') for vertex in self.adjacency_list}
-        distances[start_vertex] = 0
-        priority_queue = [(0, start_vertex)]
-        predecessors = {vertex: None for vertex in self.adjacency_list}
+        key = (start_vertex, self._version)
+        cached = self._dijkstra_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not self._csr_valid:
+            self._build_csr()
+        self._ensure_scratch()
+
+        start = self._name_to_id[start_vertex]
+        if self._unit_weights:
+            # All weights are 1, so Dijkstra degenerates to plain BFS.
+            result = _bfs_csr(self.indptr, self.indices, start, len(self._id_to_name),
+                              self._dist_buf, self._queue_buf)
+        else:
+            result = _dijkstra_csr(self.indptr, self.indices, self.weights, start, len(self._id_to_name),
+                                   self._dist_buf, self._bucket_head, self._entry_vertex, self._entry_next)
+        self._dijkstra_cache[key] = result
+        return result
 
-        while priority_queue:
-            current_distance, current_vertex = heapq.heappop(priority_queue)
+    def shortest_path(self, start, end):
+        cached = self._dijkstra_cache.get((start, self._version))
+        if cached is None and self._unit_weights:
+            # The BFS pass is cheap enough to run in full and share
+            # through the per-source cache.
+            cached = self.dijkstra(start)
+        if cached is not None:
+            distances, predecessors = cached
+            end_id = self._name_to_id[end]
+
+            if np.isinf(distances[end_id]):
+                return "No path exists", []
+
+            path, current_id = [], end_id
+            while predecessors[current_id] != -1:
+                path.append(self._id_to_name[current_id])
+                current_id = predecessors[current_id]
+            if path:
+                path.append(self._id_to_name[current_id])
+            path.reverse()
 
-            for neighbor in self.adjacency_list[current_vertex]:
-                weight = self.edge_weights.get((current_vertex, neighbor), 1)
-                distance = current_distance + weight
+            return distances[end_id], path
 
-                if distance < distances[neighbor]:
-                    distances[neighbor] = distance
-                    predecessors[neighbor] = current_vertex
-                    heapq.heappush(priority_queue, (distance, neighbor))
+        if not self._csr_valid:
+            self._build_csr()
+        if not self._rev_csr_valid:
+            self._build_reverse_csr()
 
-        return distances, predecessors
+        start_id = self._name_to_id[start]
+        end_id = self._name_to_id[end]
+        if start_id == end_id:
+            return 0.0, []
 
-    def shortest_path(self, start, end):
-        distances, predecessors = self.dijkstra(start)
-        path, current_vertex = [], end
+        best, meet, pred_f, pred_b = _bidirectional_dijkstra_csr(
+            self.indptr, self.indices, self.weights,
+            self._rindptr, self._rindices, self._rweights,
+            start_id, end_id, len(self._id_to_name))
 
-        if distances[end] == float('infinity'):
+        if meet == -1:
             return "No path exists", []
 
-        while predecessors[current_vertex] is not None:
-            path.insert(0, current_vertex)
-            current_vertex = predecessors[current_vertex]
-        if path:
-            path.insert(0, current_vertex)
-
-        return distances[end], path
+        path, current_id = [], meet
+        while current_id != -1:
+            path.append(self._id_to_name[current_id])
+            current_id = pred_f[current_id]
+        path.reverse()
+        current_id = pred_b[meet]
+        while current_id != -1:
+            path.append(self._id_to_name[current_id])
+            current_id = pred_b[current_id]
+
+        return float(best), path
+
+class EdgeDialog(simpledialog.Dialog):
+    def body(self, master):
+        tk.Label(master, text="Source vertex:").grid(row=0, sticky=tk.W)
+        tk.Label(master, text="Target vertex:").grid(row=1, sticky=tk.W)
+        tk.Label(master, text="Weight (optional, default=1):").grid(row=2, sticky=tk.W)
+        self.source_entry = tk.Entry(master)
+        self.target_entry = tk.Entry(master)
+        self.weight_entry = tk.Entry(master)
+        self.source_entry.grid(row=0, column=1, padx=5, pady=2)
+        self.target_entry.grid(row=1, column=1, padx=5, pady=2)
+        self.weight_entry.grid(row=2, column=1, padx=5, pady=2)
+        return self.source_entry
+
+    def validate(self):
+        weight_text = self.weight_entry.get().strip()
+        try:
+            weight = int(weight_text) if weight_text else 1
+        except ValueError:
+            messagebox.showwarning("Invalid input", "Weight must be an integer.", parent=self)
+            return 0
+        if weight < 1:
+            messagebox.showwarning("Invalid input", "Weight must be at least 1.", parent=self)
+            return 0
+        self._validated = (self.source_entry.get().strip(), self.target_entry.get().strip(), weight)
+        return 1
+
+    def apply(self):
+        self.result = self._validated
 
 class GraphApp(tk.Tk):
     def __init__(self):
@@ -109,6 +522,7 @@ class GraphApp(tk.Tk):
         self.graph = Graph(directed=False)
         self.title("Graph Manager")
         self.geometry("600x600")
+        self._render_pending = False
 
         self.create_widgets()
 
@@ -130,6 +544,7 @@ class GraphApp(tk.Tk):
 
     def toggle_directed(self):
         self.graph.directed = self.is_directed.get()
+        self.graph._invalidate()
         self.update_display()
 
     def add_vertex(self):
@@ -139,12 +554,12 @@ class GraphApp(tk.Tk):
             self.update_display()
 
     def add_edge(self):
-        source = simpledialog.askstring("Input", "Enter source vertex:", parent=self)
-        target = simpledialog.askstring("Input", "Enter target vertex:", parent=self)
-        weight = simpledialog.askinteger("Input", "Enter weight (optional, default=1):", parent=self, minvalue=1)
-        if source and target:
-            self.graph.add_edge(source, target, weight)
-            self.update_display()
+        dialog = EdgeDialog(self, title="Add Edge")
+        if dialog.result:
+            source, target, weight = dialog.result
+            if source and target:
+                self.graph.add_edge(source, target, weight)
+                self.update_display()
 
     def load_graph(self):
         file_path = filedialog.askopenfilename(initialdir=os.getcwd(), title="Select file", filetypes=(("Text files", "*.txt"), ("all files", "*.*")))
@@ -164,6 +579,12 @@ class GraphApp(tk.Tk):
         messagebox.showinfo("Eulerian Check", message)
 
     def update_display(self):
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._do_render)
+
+    def _do_render(self):
+        self._render_pending = False
         self.graph_display.delete(1.0, tk.END)
         self.graph_display.insert(tk.END, self.graph.display_graph())
 